@@ -1,5 +1,6 @@
 """The DLMS integration."""
 
+import functools
 import logging
 from datetime import timedelta
 from typing import Any
@@ -9,6 +10,7 @@ import shutil
 from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
@@ -26,6 +28,7 @@ from .const import (
     CONF_TIMEOUT,
     CONF_ONLY_LISTEN,
     CONF_USE_CHECKSUM,
+    CONF_LOW_LATENCY,
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
     DEFAULT_PARITY,
@@ -33,6 +36,7 @@ from .const import (
     DEFAULT_TIMEOUT,
     DEFAULT_ONLY_LISTEN,
     DEFAULT_USE_CHECKSUM,
+    DEFAULT_LOW_LATENCY,
     DEFAULT_DEVICE,
     DEFAULT_QUERY_CODE,
     DEFAULT_SERIAL_PORT,
@@ -49,6 +53,8 @@ from homeassistant.helpers.entity_platform import async_get_platforms
 
 _LOGGER = logging.getLogger(__name__)
 
+__all__ = ["async_setup", "async_setup_entry", "async_unload_entry"]
+
 PLATFORMS = [Platform.SENSOR]
 
 TEST_DLMS_SCHEMA = vol.Schema(
@@ -63,9 +69,26 @@ TEST_DLMS_SCHEMA = vol.Schema(
         vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): cv.positive_int,
         vol.Optional(CONF_ONLY_LISTEN, default=DEFAULT_ONLY_LISTEN): cv.boolean,
         vol.Optional(CONF_USE_CHECKSUM, default=DEFAULT_USE_CHECKSUM): cv.boolean,
+        vol.Optional(CONF_LOW_LATENCY, default=DEFAULT_LOW_LATENCY): cv.boolean,
     }
 )
 
+def _ensure_icon(icon_file: Path) -> None:
+    """Copy the integration icon from the repository root if missing.
+
+    Runs in the executor because it does blocking filesystem I/O.
+    """
+    if icon_file.exists():
+        _LOGGER.debug("Icon file exists in integration directory")
+        return
+    # Check if icon exists in repository root
+    repo_icon = icon_file.parent.parent.parent / "icon.png"
+    if repo_icon.exists():
+        _LOGGER.debug("Copying icon from %s to %s", repo_icon, icon_file)
+        shutil.copy(repo_icon, icon_file)
+    else:
+        _LOGGER.debug("Icon file not found in repository")
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the DLMS integration."""
     _LOGGER.info("Setting up DLMS integration")
@@ -78,213 +101,223 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER.info("DLMS log level set to %s", level)
 
     hass.services.async_register(DOMAIN, "set_log_level", set_log_level)
-    _LOGGER.info("Registering DLMS service")
+    _register_services(hass)
+
+    # Close any cached test connections when HA shuts down
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, lambda event: _close_test_conns(hass)
+    )
 
     return True
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up DLMS from a config entry."""
-    _LOGGER.info("Setting up DLMS integration")
-    
-    # Copy icon to integration directory if it doesn't exist
-    icon_file = Path(__file__).parent / "icon.png"
-    if icon_file.exists():
-        _LOGGER.debug("Icon file exists in integration directory")
-    else:
-        # Check if icon exists in repository root
-        repo_icon = Path(__file__).parent.parent.parent / "icon.png"
-        if repo_icon.exists():
-            _LOGGER.debug(f"Copying icon from {repo_icon} to {icon_file}")
-            shutil.copy(repo_icon, icon_file)
-        else:
-            _LOGGER.debug("Icon file not found in repository")
-
-    # Register service for running the test
-    async def async_run_dlms_test(call: ServiceCall) -> None:
-        """Run DLMS test."""
-        _LOGGER.info("Running DLMS test")
-        port = call.data.get(CONF_SERIAL_PORT, DEFAULT_SERIAL_PORT)
-        
-        # Create DLMSData object with settings from service call
-        dlms_data = DLMSData(
-            serial_port=port,
-            device=call.data.get(CONF_DEVICE, DEFAULT_DEVICE),
-            query_code=call.data.get(CONF_QUERY_CODE, DEFAULT_QUERY_CODE),
-            baud_rate=call.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
-            bytesize=call.data.get(CONF_BYTESIZE, DEFAULT_BYTESIZE),
-            parity=call.data.get(CONF_PARITY, DEFAULT_PARITY),
-            stopbits=call.data.get(CONF_STOPBITS, DEFAULT_STOPBITS),
-            timeout=call.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
-            only_listen=call.data.get(CONF_ONLY_LISTEN, DEFAULT_ONLY_LISTEN),
-            use_checksum=call.data.get(CONF_USE_CHECKSUM, DEFAULT_USE_CHECKSUM),
-        )
-        
-        _LOGGER.info("Starting DLMS test with port: %s", port)
-        
-        # Start reading data
+# Optional per-OBIS fields appended to the test-result line when present
+_OPT_FIELDS = (("unit", "unit"), ("date", "date"), ("time", "time"))
+
+# (DLMSData kwarg, config key, default) - drives _build_dlms_data
+_FIELDS = (
+    ("serial_port", CONF_SERIAL_PORT, DEFAULT_SERIAL_PORT),
+    ("device", CONF_DEVICE, DEFAULT_DEVICE),
+    ("query_code", CONF_QUERY_CODE, DEFAULT_QUERY_CODE),
+    ("baud_rate", CONF_BAUDRATE, DEFAULT_BAUDRATE),
+    ("bytesize", CONF_BYTESIZE, DEFAULT_BYTESIZE),
+    ("parity", CONF_PARITY, DEFAULT_PARITY),
+    ("stopbits", CONF_STOPBITS, DEFAULT_STOPBITS),
+    ("timeout", CONF_TIMEOUT, DEFAULT_TIMEOUT),
+    ("only_listen", CONF_ONLY_LISTEN, DEFAULT_ONLY_LISTEN),
+    ("use_checksum", CONF_USE_CHECKSUM, DEFAULT_USE_CHECKSUM),
+    ("low_latency", CONF_LOW_LATENCY, DEFAULT_LOW_LATENCY),
+)
+
+def _build_dlms_data(src: dict[str, Any]) -> DLMSData:
+    """Create a DLMSData from service-call or config-entry data."""
+    return DLMSData(**{kwarg: src.get(key, default) for kwarg, key, default in _FIELDS})
+
+def _get_test_dlms_data(hass: HomeAssistant, src: dict[str, Any]) -> DLMSData:
+    """Return a cached DLMSData for test calls, creating it on first use.
+
+    Keyed by the serial settings so repeated run_test/run_raw_test calls
+    reuse the already-open port instead of paying open/tcsetattr again.
+    """
+    conns = hass.data.setdefault(DOMAIN, {}).setdefault("_test_conns", {})
+    # TEST_DLMS_SCHEMA already applied defaults, so every key is present
+    key = (
+        src[CONF_SERIAL_PORT],
+        src[CONF_BAUDRATE],
+        src[CONF_BYTESIZE],
+        src[CONF_PARITY],
+        src[CONF_STOPBITS],
+    )
+    dlms_data = conns.get(key)
+    if dlms_data is None:
+        dlms_data = _build_dlms_data(src)
+        dlms_data.keep_open = True
+        conns[key] = dlms_data
+    return dlms_data
+
+def _close_test_conns(hass: HomeAssistant) -> None:
+    """Disconnect any cached test connections."""
+    conns = hass.data.get(DOMAIN, {}).pop("_test_conns", {})
+    for dlms_data in conns.values():
+        dlms_data.disconnect()
+
+async def async_run_dlms_test(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Run DLMS test."""
+    _LOGGER.info("Running DLMS test")
+
+    # Reuse an open connection for these serial settings when possible
+    dlms_data = _get_test_dlms_data(hass, call.data)
+
+    _LOGGER.info("Starting DLMS test with port: %s", dlms_data.serial_port)
+
+    # Start reading data; the context guarantees cleanup if the read raises
+    async with dlms_data:
         result = await dlms_data.read_data()
-        
-        # Format result in a readable format
-        if result:
-            _LOGGER.info("DLMS test successful! Received data:")
-            message = "DLMS test successful!\nReceived data:\n\n"
-            for obis_code, data in result.items():
-                if isinstance(data, dict):
-                    data_str = f"value: {data.get('value', 'n/a')}"
-                    if 'unit' in data and data['unit']:
-                        data_str += f", unit: {data['unit']}"
-                    if 'date' in data and data['date']:
-                        data_str += f", date: {data['date']}"
-                    if 'time' in data and data['time']:
-                        data_str += f", time: {data['time']}"
-                else:
-                    data_str = str(data)
-                
-                message += f"{obis_code}: {data_str}\n"
+
+    # One timestamp shared by every state/notification write below
+    now_str = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    # Format result in a readable format
+    if result:
+        _LOGGER.info("DLMS test successful! Received data:")
+        # Check the log level once rather than per OBIS entry
+        log_info = _LOGGER.isEnabledFor(logging.INFO)
+        # Collect lines and join once instead of growing a str per entry
+        parts = ["DLMS test successful!", "Received data:", ""]
+        for obis_code, data in result.items():
+            if isinstance(data, dict):
+                extras = [f"{label}: {v}" for key, label in _OPT_FIELDS if (v := data.get(key))]
+                data_str = f"value: {data.get('value', 'n/a')}"
+                if extras:
+                    data_str += "".join(", " + e for e in extras)
+            else:
+                data_str = str(data)
+
+            parts.append(f"{obis_code}: {data_str}")
+            if log_info:
                 _LOGGER.info("  %s: %s", obis_code, data)
-                
-            # Create notification with results
-            persistent_notification.async_create(
-                hass,
-                message,
-                title="DLMS Test Results",
-                notification_id="dlms_test_result"
-            )
-            
-            # Update sensor with results
-            hass.states.async_set(
-                "sensor.dlms_test_result", 
-                "success", 
-                {"parsed_data": result, 
-                 "last_updated": time.strftime("%Y-%m-%d %H:%M:%S"),
-                 "message": message}
-            )
-            
-        else:
-            _LOGGER.warning("DLMS test failed! No data received.")
-            message = "DLMS test failed! No data received."
-            
-            # Create notification with results
-            persistent_notification.async_create(
-                hass,
-                message,
-                title="DLMS Test Results",
-                notification_id="dlms_test_result"
-            )
-            
-            # Update sensor with results
-            hass.states.async_set(
-                "sensor.dlms_test_result", 
-                "failed", 
-                {"last_updated": time.strftime("%Y-%m-%d %H:%M:%S"),
-                 "message": message}
-            )
-        
-        # Close connection
-        dlms_data.disconnect()
 
-    async def run_raw_test(call: ServiceCall) -> None:
-        """Run DLMS test with raw data return."""
-        _LOGGER.info("Running DLMS raw test")
-        port = call.data.get(CONF_SERIAL_PORT, DEFAULT_SERIAL_PORT)
-        
-        # Create DLMSData object with settings from service call
-        dlms_data = DLMSData(
-            serial_port=port,
-            device=call.data.get(CONF_DEVICE, DEFAULT_DEVICE),
-            query_code=call.data.get(CONF_QUERY_CODE, DEFAULT_QUERY_CODE),
-            baud_rate=call.data.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
-            bytesize=call.data.get(CONF_BYTESIZE, DEFAULT_BYTESIZE),
-            parity=call.data.get(CONF_PARITY, DEFAULT_PARITY),
-            stopbits=call.data.get(CONF_STOPBITS, DEFAULT_STOPBITS),
-            timeout=call.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
-            only_listen=call.data.get(CONF_ONLY_LISTEN, DEFAULT_ONLY_LISTEN),
-            use_checksum=call.data.get(CONF_USE_CHECKSUM, DEFAULT_USE_CHECKSUM),
+        message = "\n".join(parts) + "\n"
+
+        # Single state write carries the message; no extra notification
+        hass.states.async_set(
+            "sensor.dlms_test_result",
+            "success",
+            {"parsed_data": result,
+             "last_updated": now_str,
+             "message": message}
         )
-        
-        _LOGGER.info("Starting DLMS raw test with port: %s", port)
-        
-        # Run test to get raw data
-        raw_data = await dlms_data.run_test()
-        
-        # Send result as event
-        hass.bus.async_fire("dlms_raw_test_result", {"data": raw_data})
-        _LOGGER.info("DLMS raw test completed, results sent as event")
-        
+
+    else:
+        _LOGGER.warning("DLMS test failed! No data received.")
+        message = "DLMS test failed! No data received."
+
         # Create notification with results
         persistent_notification.async_create(
             hass,
-            raw_data,
-            title="DLMS Raw Test Results",
-            notification_id="dlms_raw_test_result"
+            message,
+            title="DLMS Test Results",
+            notification_id="dlms_test_result"
         )
-        
+
         # Update sensor with results
         hass.states.async_set(
-            "sensor.dlms_raw_test_result", 
-            "completed", 
-            {"raw_data": raw_data,
-             "last_updated": time.strftime("%Y-%m-%d %H:%M:%S")}
+            "sensor.dlms_test_result",
+            "failed",
+            {"last_updated": now_str,
+             "message": message}
         )
-        
-        # Close connection
-        dlms_data.disconnect()
-        
-    async def force_data_update(call: ServiceCall) -> None:
-        """Force data update for existing integration."""
-        _LOGGER.info("Forcing DLMS data update")
-        
-        # Check if coordinator exists
-        if not hass.data.get(DOMAIN):
-            _LOGGER.error("DLMS integration not set up")
+
+
+async def run_raw_test(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Run DLMS test with raw data return."""
+    _LOGGER.info("Running DLMS raw test")
+
+    # Reuse an open connection for these serial settings when possible
+    dlms_data = _get_test_dlms_data(hass, call.data)
+
+    _LOGGER.info("Starting DLMS raw test with port: %s", dlms_data.serial_port)
+
+    # Run test to get raw data; the context guarantees cleanup on errors
+    async with dlms_data:
+        raw_data = await dlms_data.run_test()
+    now_str = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    # Send result as event
+    hass.bus.async_fire("dlms_raw_test_result", {"data": raw_data})
+    _LOGGER.info("DLMS raw test completed, results sent as event")
+
+    # The event plus one state write carry the data; no extra notification
+    hass.states.async_set(
+        "sensor.dlms_raw_test_result",
+        "completed",
+        {"raw_data": raw_data,
+         "last_updated": now_str}
+    )
+
+
+async def force_data_update(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Force data update for existing integration."""
+    _LOGGER.info("Forcing DLMS data update")
+
+    # Check if coordinator exists; look the domain dict up once
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
+        _LOGGER.error("DLMS integration not set up")
+        return
+
+    # Get entry ID - if specified, use it, otherwise take the first available
+    entry_id = call.data.get("entry_id")
+    if entry_id:
+        if entry_id not in domain_data:
+            _LOGGER.error("DLMS integration with ID %s not found", entry_id)
             return
-            
-        # Get entry ID - if specified, use it, otherwise take the first available
-        entry_id = call.data.get("entry_id")
-        if entry_id:
-            if entry_id not in hass.data[DOMAIN]:
-                _LOGGER.error("DLMS integration with ID %s not found", entry_id)
-                return
-            coordinator = hass.data[DOMAIN][entry_id]
-        else:
-            # Take the first available entry
-            if not hass.data[DOMAIN]:
-                _LOGGER.error("No DLMS integrations found")
-                return
-            entry_id = next(iter(hass.data[DOMAIN]))
-            coordinator = hass.data[DOMAIN][entry_id]
-            
-        _LOGGER.info("Forcing update for DLMS integration %s", entry_id)
-        
-        # Start update
-        await coordinator.async_refresh()
-        _LOGGER.info("DLMS data update completed")
-        
+    else:
+        # Take the first available entry (internal keys start with "_")
+        entry_id = next((k for k in domain_data if not k.startswith("_")), None)
+        if entry_id is None:
+            _LOGGER.error("No DLMS integrations found")
+            return
+    coordinator = domain_data[entry_id]
+
+    _LOGGER.info("Forcing update for DLMS integration %s", entry_id)
+
+    # Start update
+    await coordinator.async_refresh()
+    _LOGGER.info("DLMS data update completed")
+
+def _register_services(hass: HomeAssistant) -> None:
+    """Register the DLMS services once, no matter how many entries load."""
+    if hass.services.has_service(DOMAIN, "run_test"):
+        return
     _LOGGER.info("Registering DLMS services")
-    hass.services.async_register(DOMAIN, "run_test", async_run_dlms_test, schema=TEST_DLMS_SCHEMA)
-    hass.services.async_register(DOMAIN, "run_raw_test", run_raw_test, schema=TEST_DLMS_SCHEMA)
-    hass.services.async_register(DOMAIN, "force_update", force_data_update)
-
-    # Init DLMS data handler
-    device_name = entry.data.get(CONF_DEVICE, "DLMS Meter")
-    serial_port = entry.data.get(CONF_SERIAL_PORT, DEFAULT_SERIAL_PORT)
-    query_code = entry.data.get(CONF_QUERY_CODE, DEFAULT_QUERY_CODE)
-    
-    # Create data update coordinator
-    update_interval = timedelta(seconds=entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_UPDATE_INTERVAL))
+    hass.services.async_register(DOMAIN, "run_test", functools.partial(async_run_dlms_test, hass), schema=TEST_DLMS_SCHEMA)
+    hass.services.async_register(DOMAIN, "run_raw_test", functools.partial(run_raw_test, hass), schema=TEST_DLMS_SCHEMA)
+    hass.services.async_register(DOMAIN, "force_update", functools.partial(force_data_update, hass))
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up DLMS from a config entry."""
+    _LOGGER.info("Setting up DLMS integration")
     
-    dlms_data = DLMSData(
-        serial_port=serial_port,
-        device=device_name,
-        query_code=query_code,
-        baud_rate=entry.data.get(CONF_BAUDRATE, 300), # Use 300 baud as initial speed
-        bytesize=entry.data.get(CONF_BYTESIZE, DEFAULT_BYTESIZE),
-        parity=entry.data.get(CONF_PARITY, DEFAULT_PARITY),
-        stopbits=entry.data.get(CONF_STOPBITS, DEFAULT_STOPBITS),
-        timeout=entry.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
-        only_listen=entry.data.get(CONF_ONLY_LISTEN, DEFAULT_ONLY_LISTEN),
-        use_checksum=entry.data.get(CONF_USE_CHECKSUM, DEFAULT_USE_CHECKSUM)
+    # Copy icon to integration directory if it doesn't exist.
+    # The stat/copy is blocking I/O, so run it in the executor and only
+    # once per HA run - further entries skip the syscall entirely.
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if not domain_data.get("_icon_checked"):
+        await hass.async_add_executor_job(_ensure_icon, Path(__file__).parent / "icon.png")
+        domain_data["_icon_checked"] = True
+
+    # Create data update coordinator; the config flow stores the
+    # interval under CONF_UPDATE_INTERVAL, with CONF_SCAN_INTERVAL kept
+    # as a fallback for entries imported from YAML
+    update_interval = timedelta(
+        seconds=entry.data.get(
+            CONF_UPDATE_INTERVAL,
+            entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        )
     )
+
+    # Init DLMS data handler (starts at 300 baud for the handshake)
+    dlms_data = _build_dlms_data(entry.data)
     coordinator = DLMSDataUpdateCoordinator(
         hass,
         dlms_data,
@@ -318,6 +351,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         coordinator = hass.data[DOMAIN][entry.entry_id]
         coordinator.dlms_data.disconnect()
         hass.data[DOMAIN].pop(entry.entry_id)
+        # Drop cached test connections alongside the entry
+        _close_test_conns(hass)
         
     _LOGGER.info("DLMS integration unloaded")
     return unload_ok
@@ -17,12 +17,14 @@ from .const import (
     CONF_PARITY,
     CONF_STOPBITS,
     CONF_TIMEOUT,
+    CONF_LOW_LATENCY,
     CONF_UPDATE_INTERVAL,
     DEFAULT_BAUDRATE,
     DEFAULT_BYTESIZE,
     DEFAULT_PARITY,
     DEFAULT_STOPBITS,
     DEFAULT_TIMEOUT,
+    DEFAULT_LOW_LATENCY,
     DEFAULT_DEVICE,
     DEFAULT_QUERY_CODE,
     DEFAULT_SERIAL_PORT,
@@ -31,6 +33,23 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Build the schema once at import so every form render reuses the same
+# compiled voluptuous object instead of rebuilding it per step
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DEVICE, default="DLMS Meter"): str,
+        vol.Required(CONF_SERIAL_PORT, default=DEFAULT_SERIAL_PORT): str,
+        vol.Required(CONF_QUERY_CODE, default=DEFAULT_QUERY_CODE): str,
+        vol.Required(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): int,
+        vol.Required(CONF_BYTESIZE, default=DEFAULT_BYTESIZE): int,
+        vol.Required(CONF_PARITY, default=DEFAULT_PARITY): str,
+        vol.Required(CONF_STOPBITS, default=DEFAULT_STOPBITS): int,
+        vol.Required(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): int,
+        vol.Required(CONF_LOW_LATENCY, default=DEFAULT_LOW_LATENCY): bool,
+        vol.Required(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): int,
+    }
+)
+
 class DLMSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for DLMS."""
 
@@ -62,19 +81,7 @@ class DLMSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_DEVICE, default="DLMS Meter"): str,
-                    vol.Required(CONF_SERIAL_PORT, default=DEFAULT_SERIAL_PORT): str,
-                    vol.Required(CONF_QUERY_CODE, default=DEFAULT_QUERY_CODE): str,
-                    vol.Required(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): int,
-                    vol.Required(CONF_BYTESIZE, default=DEFAULT_BYTESIZE): int,
-                    vol.Required(CONF_PARITY, default=DEFAULT_PARITY): str,
-                    vol.Required(CONF_STOPBITS, default=DEFAULT_STOPBITS): int,
-                    vol.Required(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): int,
-                    vol.Required(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): int,
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
 
@@ -1,139 +1,111 @@
 """Constants for DLMS integration."""
 from __future__ import annotations
 
-from typing import Final
+import sys
+import types
+from typing import Final, NamedTuple
 from homeassistant.const import Platform, CONF_NAME, CONF_SCAN_INTERVAL
 
 # The domain of your component. Should be equal to the name of your component.
 DOMAIN: Final = "dlms"
 
 # Configuration parameters
-CONF_SERIAL_PORT: Final = "serial_port"
-CONF_DEVICE: Final = "device"
-CONF_QUERY_CODE: Final = "query_code"
-CONF_BAUDRATE: Final = "baudrate"
-CONF_BYTESIZE: Final = "bytesize"
-CONF_PARITY: Final = "parity"
-CONF_STOPBITS: Final = "stopbits"
-CONF_TIMEOUT: Final = "timeout"
-CONF_ONLY_LISTEN: Final = "only_listen"
-CONF_USE_CHECKSUM: Final = "use_checksum"
-CONF_UPDATE_INTERVAL: Final = "update_interval"
+CONF_SERIAL_PORT = "serial_port"
+CONF_DEVICE = "device"
+CONF_QUERY_CODE = "query_code"
+CONF_BAUDRATE = "baudrate"
+CONF_BYTESIZE = "bytesize"
+CONF_PARITY = "parity"
+CONF_STOPBITS = "stopbits"
+CONF_TIMEOUT = "timeout"
+CONF_ONLY_LISTEN = "only_listen"
+CONF_USE_CHECKSUM = "use_checksum"
+CONF_LOW_LATENCY = "low_latency"
+CONF_UPDATE_INTERVAL = "update_interval"
 
 # Default values
-DEFAULT_SERIAL_PORT: Final = "/dev/serial/by-id/usb-Silicon_Labs_CP2102_USB_to_UART_Bridge_Controller_0001-if00-port0"
-DEFAULT_DEVICE: Final = ""
-DEFAULT_QUERY_CODE: Final = "?"
-DEFAULT_BAUDRATE: Final = 300  # Начальная скорость 300 бод
-DEFAULT_BYTESIZE: Final = 7
-DEFAULT_PARITY: Final = "E"
-DEFAULT_STOPBITS: Final = 1
-DEFAULT_TIMEOUT: Final = 3  # 3 секунды как в тестовом скрипте
-DEFAULT_ONLY_LISTEN: Final = False
-DEFAULT_USE_CHECKSUM: Final = True
-DEFAULT_UPDATE_INTERVAL: Final = 3600  # 1 час в секундах
+DEFAULT_SERIAL_PORT = "/dev/serial/by-id/usb-Silicon_Labs_CP2102_USB_to_UART_Bridge_Controller_0001-if00-port0"
+DEFAULT_DEVICE = ""
+DEFAULT_QUERY_CODE = "?"
+DEFAULT_BAUDRATE = 300  # Начальная скорость 300 бод
+DEFAULT_BYTESIZE = 7
+DEFAULT_PARITY = "E"
+DEFAULT_STOPBITS = 1
+DEFAULT_TIMEOUT = 3  # 3 секунды как в тестовом скрипте
+DEFAULT_ONLY_LISTEN = False
+DEFAULT_USE_CHECKSUM = True
+DEFAULT_LOW_LATENCY = True  # Cut the FTDI 16 ms latency timer to 1 ms
+DEFAULT_UPDATE_INTERVAL = 3600  # 1 час в секундах
 
-# OBIS codes for different measurements
-OBIS_CODES = {
-    "1.0.0.1.0.255": {
-        "name": "Active Energy Import",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "unit": "kWh",
-    },
-    "1.0.0.2.0.255": {
-        "name": "Active Energy Export",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "unit": "kWh",
-    },
-    "1.0.0.3.0.255": {
-        "name": "Reactive Energy Import",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "unit": "kvarh",
-    },
-    "1.0.0.4.0.255": {
-        "name": "Reactive Energy Export",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-        "unit": "kvarh",
-    },
-    "1.0.0.5.0.255": {
-        "name": "Active Power Import",
-        "device_class": "power",
-        "state_class": "measurement",
-        "unit": "W",
-    },
-    "1.0.0.6.0.255": {
-        "name": "Active Power Export",
-        "device_class": "power",
-        "state_class": "measurement",
-        "unit": "W",
-    },
-    "1.0.0.7.0.255": {
-        "name": "Reactive Power Import",
-        "device_class": "power",
-        "state_class": "measurement",
-        "unit": "var",
-    },
-    "1.0.0.8.0.255": {
-        "name": "Reactive Power Export",
-        "device_class": "power",
-        "state_class": "measurement",
-        "unit": "var",
-    },
-    "1.0.0.9.0.255": {
-        "name": "Current L1",
-        "device_class": "current",
-        "state_class": "measurement",
-        "unit": "A",
-    },
-    "1.0.0.10.0.255": {
-        "name": "Current L2",
-        "device_class": "current",
-        "state_class": "measurement",
-        "unit": "A",
-    },
-    "1.0.0.11.0.255": {
-        "name": "Current L3",
-        "device_class": "current",
-        "state_class": "measurement",
-        "unit": "A",
-    },
-    "1.0.0.12.0.255": {
-        "name": "Voltage L1",
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "unit": "V",
-    },
-    "1.0.0.13.0.255": {
-        "name": "Voltage L2",
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "unit": "V",
-    },
-    "1.0.0.14.0.255": {
-        "name": "Voltage L3",
-        "device_class": "voltage",
-        "state_class": "measurement",
-        "unit": "V",
-    },
-    "1.0.0.15.0.255": {
-        "name": "Power Factor",
-        "device_class": "power_factor",
-        "state_class": "measurement",
-        "unit": None,
-    },
-    "1.0.0.16.0.255": {
-        "name": "Frequency",
-        "device_class": "frequency",
-        "state_class": "measurement",
-        "unit": "Hz",
-    },
-}
+# Adaptive polling back-off: after this many identical reads in a row the
+# coordinator doubles its interval, up to base interval * max factor
+UNCHANGED_POLLS_BEFORE_BACKOFF = 3
+MAX_BACKOFF_FACTOR = 8
+
+class ObisInfo(NamedTuple):
+    """Static description of one OBIS register.
+
+    Every entry has the same four fields, so a NamedTuple is both
+    smaller than a per-entry dict and faster to read (slot access
+    instead of a hash lookup).
+    """
+
+    name: str
+    device_class: str | None
+    state_class: str
+    unit: str | None
+
+# OBIS codes for different measurements as flat (code, name,
+# device_class, state_class, unit) rows; one tuple literal lives in
+# the .pyc as a single constant instead of 16 dict builds at import
+_ROWS: Final = (
+    ("1.0.0.1.0.255", "Active Energy Import", "energy", "total_increasing", "kWh"),
+    ("1.0.0.2.0.255", "Active Energy Export", "energy", "total_increasing", "kWh"),
+    ("1.0.0.3.0.255", "Reactive Energy Import", "energy", "total_increasing", "kvarh"),
+    ("1.0.0.4.0.255", "Reactive Energy Export", "energy", "total_increasing", "kvarh"),
+    ("1.0.0.5.0.255", "Active Power Import", "power", "measurement", "W"),
+    ("1.0.0.6.0.255", "Active Power Export", "power", "measurement", "W"),
+    ("1.0.0.7.0.255", "Reactive Power Import", "power", "measurement", "var"),
+    ("1.0.0.8.0.255", "Reactive Power Export", "power", "measurement", "var"),
+    ("1.0.0.9.0.255", "Current L1", "current", "measurement", "A"),
+    ("1.0.0.10.0.255", "Current L2", "current", "measurement", "A"),
+    ("1.0.0.11.0.255", "Current L3", "current", "measurement", "A"),
+    ("1.0.0.12.0.255", "Voltage L1", "voltage", "measurement", "V"),
+    ("1.0.0.13.0.255", "Voltage L2", "voltage", "measurement", "V"),
+    ("1.0.0.14.0.255", "Voltage L3", "voltage", "measurement", "V"),
+    ("1.0.0.15.0.255", "Power Factor", "power_factor", "measurement", None),
+    ("1.0.0.16.0.255", "Frequency", "frequency", "measurement", "Hz"),
+)
+
+def pack_obis(obis: str) -> int:
+    """Pack a dotted six-group OBIS code into a single 48-bit integer.
+
+    Small-int keys hash to themselves and compare with one C-level
+    equality check, unlike the 14-character code strings.
+    """
+    a, b, c, d, e, f = map(int, obis.split("."))
+    return (a << 40) | (b << 32) | (c << 24) | (d << 16) | (e << 8) | f
+
+# Keyed by packed integer; the repeated value strings ("energy",
+# "measurement", "kWh", ...) are interned so the entries share one
+# string object each, and the proxy guards against accidental mutation.
+OBIS_CODES: Final = types.MappingProxyType({
+    pack_obis(code): ObisInfo(
+        *(sys.intern(val) if isinstance(val, str) else val for val in row)
+    )
+    for code, *row in _ROWS
+})
+
+# Precomputed views over OBIS_CODES: a frozenset for membership tests
+# and a device_class -> ((code, info), ...) index for grouped lookups,
+# both built once at import instead of rescanning the table at runtime
+OBIS_KEYS: Final = frozenset(OBIS_CODES)
+OBIS_BY_CLASS: Final = types.MappingProxyType({
+    cls: tuple((code, info) for code, info in OBIS_CODES.items() if info.device_class == cls)
+    for cls in {info.device_class for info in OBIS_CODES.values()}
+})
 
 PLATFORMS: Final = [Platform.SENSOR]
 
 # Настройки логирования
-DEFAULT_LOG_LEVEL: Final = "INFO"  # Изменено с DEBUG на INFO
+DEFAULT_LOG_LEVEL = "INFO"  # Изменено с DEBUG на INFO
@@ -1,8 +1,9 @@
 """Support for DLMS sensors."""
 
 import logging
+import sys
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -15,122 +16,98 @@ from .dlms import DLMSDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-# OBIS коды для различных измерений
-OBIS_CODES = {
-    "1.8.0": {
-        "name": "1.8.0",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "2.8.0": {
-        "name": "2.8.0",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "9.2.0": {
-        "name": "9.2.0",
-        "unit": "kVA",
-        "device_class": None,
-        "state_class": "measurement",
-    },
-    "9.6.0": {
-        "name": "9.6.0",
-        "unit": "kVA",
-        "device_class": None,
-        "state_class": "measurement",
-    },
-    "132.8.0": {
-        "name": "132.8.0",
-        "unit": "kvarh",
-        "device_class": None,
-        "state_class": "total_increasing",
-    },
-    "9.8.0": {
-        "name": "9.8.0",
-        "unit": "kVAh",
-        "device_class": None,
-        "state_class": "total_increasing",
-    },
-    "0.1.0": {
-        "name": "0.1.0",
-        "unit": None,
-        "device_class": "power_factor",
-        "state_class": "measurement",
-    },
-    "1.8.1": {
-        "name": "1.8.1",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "1.8.2": {
-        "name": "1.8.2",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "1.8.3": {
-        "name": "1.8.3",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "1.8.4": {
-        "name": "1.8.4",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "1.8.5": {
-        "name": "1.8.5",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "1.8.6": {
-        "name": "1.8.6",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "1.8.7": {
-        "name": "1.8.7",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-    "1.8.8": {
-        "name": "1.8.8",
-        "unit": "kWh",
-        "device_class": "energy",
-        "state_class": "total_increasing",
-    },
-}
+class ObisConfig(NamedTuple):
+    """Static description of one sensor's OBIS register.
+
+    Attribute access on a NamedTuple is a slot read, cheaper than the
+    config.get chain the constructor used to run per field.
+    """
+
+    name: str
+    unit: str | None
+    device_class: str | None
+    state_class: str
+
+# OBIS коды для различных измерений; one flat tuple literal instead of
+# 15 inner dict builds at import
+OBIS_CONFIGS = (
+    ObisConfig("1.8.0", "kWh", "energy", "total_increasing"),
+    ObisConfig("2.8.0", "kWh", "energy", "total_increasing"),
+    ObisConfig("9.2.0", "kVA", None, "measurement"),
+    ObisConfig("9.6.0", "kVA", None, "measurement"),
+    ObisConfig("132.8.0", "kvarh", None, "total_increasing"),
+    ObisConfig("9.8.0", "kVAh", None, "total_increasing"),
+    ObisConfig("0.1.0", None, "power_factor", "measurement"),
+    ObisConfig("1.8.1", "kWh", "energy", "total_increasing"),
+    ObisConfig("1.8.2", "kWh", "energy", "total_increasing"),
+    ObisConfig("1.8.3", "kWh", "energy", "total_increasing"),
+    ObisConfig("1.8.4", "kWh", "energy", "total_increasing"),
+    ObisConfig("1.8.5", "kWh", "energy", "total_increasing"),
+    ObisConfig("1.8.6", "kWh", "energy", "total_increasing"),
+    ObisConfig("1.8.7", "kWh", "energy", "total_increasing"),
+    ObisConfig("1.8.8", "kWh", "energy", "total_increasing"),
+)
+
+# entity_id / unique_id pairs precomputed once at import; the formatted
+# code only ever renders one way, so there is no reason to rebuild the
+# strings for every sensor on every startup
+_ENTITY_IDS: dict[str, tuple[str, str]] = {}
+for _config in OBIS_CONFIGS:
+    _formatted = _config.name.replace(".", "_")
+    _ENTITY_IDS[_config.name] = (f"sensor.dlms_{_formatted}", f"dlms_{_formatted}")
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up DLMS sensor based on config_entry."""
-    _LOGGER.info("Setting up DLMS sensors")
-    
+    _LOGGER.debug("Setting up DLMS sensors")
+
+    # Entry setup always stores the coordinator before forwarding the
+    # platform; a missing key would be a bug better surfaced as KeyError
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    if not coordinator:
-        _LOGGER.error("No coordinator found for entry_id: %s", entry.entry_id)
-        return
 
     # Создаём сенсоры сразу, без ожидания данных
-    sensors = [
-        DLMSSensor(coordinator, obis_code, config)
-        for obis_code, config in OBIS_CODES.items()
-    ]
-    
-    _LOGGER.info("Adding %d DLMS sensors", len(sensors))
-    async_add_entities(sensors, True)
-    _LOGGER.info("DLMS sensors setup completed")
+    sensors = [DLMSSensor(coordinator, config) for config in OBIS_CONFIGS]
+    coordinator.sensors = sensors
+
+    # One coordinator listener fans the update out to every sensor in a
+    # tight loop, instead of 15 callbacks dispatched one by one
+    last_data: Any = None
+    last_available: bool | None = None
+
+    def _write_states() -> None:
+        nonlocal last_data, last_available
+        # Unchanged polls hand back the same data object by identity,
+        # so steady-state dispatches skip the 15 state writes entirely
+        if coordinator.data is last_data and coordinator.last_update_success == last_available:
+            return
+        last_data = coordinator.data
+        last_available = available = coordinator.last_update_success
+        data = coordinator.data or {}
+        for sensor in coordinator.sensors:
+            sensor._attr_available = available
+            # Resolve the value once per update so native_value is a
+            # plain attribute read on every state access
+            obis_data = data.get(sensor._obis_code)
+            sensor._cached_value = obis_data.get("value") if obis_data else None
+            if sensor.hass is not None:
+                sensor.async_write_ha_state()
+
+    entry.async_on_unload(coordinator.async_add_listener(_write_states))
+
+    _LOGGER.debug("Adding %d DLMS sensors", len(sensors))
+    # The coordinator already ran its first refresh in async_setup_entry
+    # and the constructors seeded their caches from it, so there is
+    # nothing for a per-entity pre-add update round to fetch
+    async_add_entities(sensors, False)
+    _LOGGER.debug("DLMS sensors setup completed")
 
 class DLMSBaseSensor(SensorEntity):
     """Base class for DLMS sensors."""
 
+    # The immutable references live in slots; the _attr_* values still
+    # land in the instance __dict__ Entity provides, but the hot fields
+    # read through fixed offsets instead of hash lookups
+    __slots__ = ("coordinator", "_obis_code", "_cached_value")
+
     def __init__(
         self,
         coordinator: DLMSDataUpdateCoordinator,
@@ -144,67 +121,42 @@ class DLMSBaseSensor(SensorEntity):
         """Initialize the sensor."""
         self.coordinator = coordinator
         self._attr_name = name
-        self._obis_code = obis_code
-        # Генерируем entity_id в формате dlms_1_8_0
-        formatted_code = obis_code.replace(".", "_")
-        self.entity_id = f"sensor.dlms_{formatted_code}"
-        self._attr_unique_id = f"dlms_{formatted_code}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, coordinator.dlms_data.serial_port)},
-            "name": f"DLMS Meter ({coordinator.dlms_data.serial_port})",
-            "manufacturer": "LGZ",
-            "model": "LGZ5",
-        }
+        # Interned to match the parser's interned keys, so the per-read
+        # dict probes compare by identity
+        self._obis_code = obis_code = sys.intern(obis_code)
+        # Seed from data the coordinator may already hold so the value
+        # shows on the first state write, before the first listener call
+        obis_data = coordinator.data.get(obis_code) if coordinator.data else None
+        self._cached_value = obis_data.get("value") if obis_data else None
+        # Kept current by the batched listener; an attribute read is
+        # cheaper than the property HA would otherwise invoke
+        self._attr_available = coordinator.last_update_success
+        # entity_id в формате dlms_1_8_0, из таблицы построенной при импорте
+        ids = _ENTITY_IDS.get(obis_code)
+        if ids is None:
+            formatted_code = obis_code.replace(".", "_")
+            ids = (f"sensor.dlms_{formatted_code}", f"dlms_{formatted_code}")
+        self.entity_id, self._attr_unique_id = ids
+        # All sensors of one meter share the coordinator's device_info
+        # dict instead of building 15 identical copies
+        self._attr_device_info = coordinator._device_info
         self._attr_native_unit_of_measurement = unit_of_measurement
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         self._attr_icon = icon
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
-
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-        data = self.coordinator.data.get(self._obis_code)
-        if not data:
-            return None
-        return data.get("value")
+        return self._cached_value
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return entity specific state attributes."""
-        if not self.coordinator.data:
-            return None
-            
-        attrs = {}
-        
-        # Проверяем, есть ли данные для конкретного OBIS кода
-        obis_data = self.coordinator.data.get(self._obis_code)
-        if obis_data:
-            # Проверяем, есть ли индивидуальные данные о дате и времени для этого кода
-            if 'date' in obis_data:
-                attrs['measurement_date'] = obis_data['date']
-            if 'time' in obis_data:
-                attrs['measurement_time'] = obis_data['time']
-        
-        # Если для этого кода нет своих данных о дате и времени,
-        # используем общие данные (если они есть)
-        if 'measurement_date' not in attrs and '_date' in self.coordinator.data:
-            attrs['measurement_date'] = self.coordinator.data['_date']
-        if 'measurement_time' not in attrs and '_time' in self.coordinator.data:
-            attrs['measurement_time'] = self.coordinator.data['_time']
-            
-        return attrs
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return self._attr_unique_id
+        # Pre-resolved by the coordinator after each update; codes
+        # without their own date/time share the telegram-wide dict
+        coordinator = self.coordinator
+        return coordinator._attrs_by_obis.get(self._obis_code) or coordinator._common_attrs
 
 class DLMSSensor(DLMSBaseSensor):
     """Representation of a DLMS sensor."""
@@ -212,17 +164,8 @@ class DLMSSensor(DLMSBaseSensor):
     def __init__(
         self,
         coordinator: DLMSDataUpdateCoordinator,
-        obis_code: str,
-        config: dict[str, Any],
+        config: ObisConfig,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, config.get("name", f"DLMS {obis_code}"), obis_code, config.get("unit"), config.get("device_class"), config.get("state_class"))
-        self._attr_should_poll = False
-        self._attr_available = False
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added."""
-        await super().async_added_to_hass()
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        ) 
\ No newline at end of file
+        super().__init__(coordinator, config.name, config.name, config.unit, config.device_class, config.state_class)
+        self._attr_should_poll = False
\ No newline at end of file